@@ -0,0 +1,51 @@
+// checksum_cache.go - In-process memoization of per-file checksums
+package internal
+
+import (
+	"os"
+	"sync"
+)
+
+// checksumEntry is a cached checksum together with the stat data it was computed for
+type checksumEntry struct {
+	modTime  int64
+	size     int64
+	checksum string
+}
+
+// checksumCache maps file path → last computed checksum.
+// Incremental runs checksum every file in ProcessDirectoryIncremental and
+// then again in WriteSplitOutputIncremental; the cache turns the second pass
+// into a stat + map lookup instead of a full read + hash.
+var checksumCache = struct {
+	sync.Mutex
+	entries map[string]checksumEntry
+}{entries: make(map[string]checksumEntry)}
+
+// cachedFileChecksum returns computeFileChecksum(path), reusing the previous
+// result while the file's size and modification time are unchanged.
+func cachedFileChecksum(path string) (string, error) {
+	info, err := os.Stat(path)
+	if err != nil {
+		return "", err
+	}
+	modTime := info.ModTime().UnixNano()
+	size := info.Size()
+
+	checksumCache.Lock()
+	entry, ok := checksumCache.entries[path]
+	checksumCache.Unlock()
+	if ok && entry.modTime == modTime && entry.size == size {
+		return entry.checksum, nil
+	}
+
+	checksum, err := computeFileChecksum(path)
+	if err != nil {
+		return "", err
+	}
+
+	checksumCache.Lock()
+	checksumCache.entries[path] = checksumEntry{modTime: modTime, size: size, checksum: checksum}
+	checksumCache.Unlock()
+	return checksum, nil
+}
@@ -31,7 +31,7 @@ func computeShardChecksum(paths []string) string {
 	sort.Strings(paths)
 	h := fnv.New128a()
 	for _, p := range paths {
-		checksum, err := computeFileChecksum(p)
+		checksum, err := cachedFileChecksum(p)
 		if err != nil {
 			h.Write([]byte(p))
 			continue
@@ -32,7 +32,7 @@ func computeShardChecksum(paths []string) string {
 	sort.Strings(paths)
 	h := xxh3.New128()
 	for _, p := range paths {
-		checksum, err := computeFileChecksum(p)
+		checksum, err := cachedFileChecksum(p)
 		if err != nil {
 			h.Write([]byte(p))
 			continue
@@ -87,7 +87,10 @@ func (dp *DirProcessor) collectFiles(rootPath string) ([]Job, error) {
 		ignoreMatcher = NewIgnoreMatcher(rootPath)
 	}
 
-	err := filepath.Walk(rootPath, func(path string, info fs.FileInfo, err error) error {
+	// WalkDir reads the directory-entry type from readdir instead of issuing
+	// an lstat per entry like filepath.Walk; collecting only needs names and
+	// IsDir, so the per-file syscall is pure overhead.
+	err := filepath.WalkDir(rootPath, func(path string, d fs.DirEntry, err error) error {
 		if err != nil {
 			// Skip files/directories that can't be accessed
 			return nil
@@ -99,9 +102,9 @@ func (dp *DirProcessor) collectFiles(rootPath string) ([]Job, error) {
 		}
 
 		// Check if path matches gitignore patterns
-		if ignoreMatcher != nil && ignoreMatcher.Matches(relPath, info.IsDir()) {
+		if ignoreMatcher != nil && ignoreMatcher.Matches(relPath, d.IsDir()) {
 			// If it's a directory and we should skip it entirely
-			if info.IsDir() {
+			if d.IsDir() {
 				return filepath.SkipDir
 			}
 			// Skip the file
@@ -112,14 +115,14 @@ func (dp *DirProcessor) collectFiles(rootPath string) ([]Job, error) {
 		// except for .gitignore itself and the root path itself
 		base := filepath.Base(path)
 		if len(base) > 0 && base[0] == '.' && base != ".gitignore" && path != rootPath {
-			if info.IsDir() {
+			if d.IsDir() {
 				return filepath.SkipDir
 			}
 			return nil
 		}
 
 		// Skip directories if not recursive
-		if info.IsDir() {
+		if d.IsDir() {
 			if !dp.recursive && path != rootPath {
 				return filepath.SkipDir
 			}
@@ -195,6 +198,12 @@ func (dp *DirProcessor) worker(jobsChan <-chan Job, resultsChan chan<- DirResult
 	}
 }
 
+// symbolKey identifies a symbol within one file for deduplication
+type symbolKey struct {
+	name  string
+	start int
+}
+
 // processFile processes a single file
 func (dp *DirProcessor) processFile(job Job) DirResult {
 	result := DirResult{
@@ -259,13 +268,12 @@ func (dp *DirProcessor) processFile(job Job) DirResult {
 			structResult, err := structFinder.FindStructures(job.Path)
 			if err == nil {
 				// Dedup: only add types not already in Classes (from class_pattern)
-				seen := make(map[string]bool, len(result.Classes))
+				seen := make(map[symbolKey]bool, len(result.Classes))
 				for _, c := range result.Classes {
-					seen[c.Name+":"+strconv.Itoa(c.Start)] = true
+					seen[symbolKey{c.Name, c.Start}] = true
 				}
 				for _, typ := range structResult.Types {
-					key := typ.Name + ":" + strconv.Itoa(typ.Start)
-					if !seen[key] {
+					if !seen[symbolKey{typ.Name, typ.Start}] {
 						result.Classes = append(result.Classes, ClassBounds{
 							Name:  typ.Name,
 							Start: typ.Start,
@@ -389,8 +397,15 @@ func formatDirResultsTree(results []DirResult, full bool) string {
 }
 
 func buildTreeOutput(node *DirTreeNode, prefix string, isLast bool) string {
-	var output string
+	var sb strings.Builder
+	writeTreeOutput(&sb, node, prefix, isLast)
+	return sb.String()
+}
 
+// writeTreeOutput renders node and its children into sb. Writing into one
+// shared builder keeps tree output linear in the number of symbols instead of
+// re-copying the accumulated string at every level.
+func writeTreeOutput(sb *strings.Builder, node *DirTreeNode, prefix string, isLast bool) {
 	// Determine connector
 	connector := "├── "
 	if isLast {
@@ -398,7 +413,7 @@ func buildTreeOutput(node *DirTreeNode, prefix string, isLast bool) string {
 	}
 
 	if node.Path != "" {
-		output += prefix + connector + filepath.Base(node.Path) + "\n"
+		sb.WriteString(prefix + connector + filepath.Base(node.Path) + "\n")
 		newPrefix := prefix
 		if isLast {
 			newPrefix += "    "
@@ -413,14 +428,14 @@ func buildTreeOutput(node *DirTreeNode, prefix string, isLast bool) string {
 				if i == len(node.Functions)+len(node.Classes)-1 {
 					funcPrefix = newPrefix + "└── "
 				}
-				output += funcPrefix + "def " + fn.Name + " (line " + strconv.Itoa(fn.Start) + ")\n"
+				writeSymbolLine(sb, funcPrefix, "def ", fn.Name, fn.Start)
 			}
 			for i, c := range node.Classes {
 				classPrefix := newPrefix + "├── "
 				if i == len(node.Classes)-1 && len(node.Functions) == 0 {
 					classPrefix = newPrefix + "└── "
 				}
-				output += classPrefix + "class " + c.Name + " (line " + strconv.Itoa(c.Start) + ")\n"
+				writeSymbolLine(sb, classPrefix, "class ", c.Name, c.Start)
 			}
 		}
 	}
@@ -432,23 +447,42 @@ func buildTreeOutput(node *DirTreeNode, prefix string, isLast bool) string {
 	}
 
 	for i, child := range children {
-		output += buildTreeOutput(child, prefix, i == len(children)-1)
+		writeTreeOutput(sb, child, prefix, i == len(children)-1)
 	}
+}
 
-	return output
+// writeSymbolLine writes "<prefix><keyword><name> (line N)\n" without
+// building intermediate strings.
+func writeSymbolLine(sb *strings.Builder, prefix, keyword, name string, line int) {
+	sb.WriteString(prefix)
+	sb.WriteString(keyword)
+	sb.WriteString(name)
+	sb.WriteString(" (line ")
+	sb.WriteString(strconv.Itoa(line))
+	sb.WriteString(")\n")
 }
 
 func formatDirResultsGrep(results []DirResult) string {
-	var output string
+	var sb strings.Builder
 	for _, r := range results {
 		for _, fn := range r.Functions {
-			output += r.Path + ":" + strconv.Itoa(fn.Start) + ": " + fn.Name + "\n"
+			writeGrepLine(&sb, r.Path, fn.Start, fn.Name)
 		}
 		for _, cl := range r.Classes {
-			output += r.Path + ":" + strconv.Itoa(cl.Start) + ": " + cl.Name + "\n"
+			writeGrepLine(&sb, r.Path, cl.Start, cl.Name)
 		}
 	}
-	return output
+	return sb.String()
+}
+
+// writeGrepLine writes "path:line: name\n".
+func writeGrepLine(sb *strings.Builder, path string, line int, name string) {
+	sb.WriteString(path)
+	sb.WriteByte(':')
+	sb.WriteString(strconv.Itoa(line))
+	sb.WriteString(": ")
+	sb.WriteString(name)
+	sb.WriteByte('\n')
 }
 
 // IgnoreMatcher handles .gitignore pattern matching
@@ -575,7 +609,7 @@ func CollectSourceFiles(rootPath string, langConfig *LanguageConfig, recursive b
 	}
 
 	var files []string
-	err := filepath.Walk(rootPath, func(path string, info fs.FileInfo, err error) error {
+	err := filepath.WalkDir(rootPath, func(path string, d fs.DirEntry, err error) error {
 		if err != nil {
 			return nil
 		}
@@ -585,8 +619,8 @@ func CollectSourceFiles(rootPath string, langConfig *LanguageConfig, recursive b
 			return nil
 		}
 
-		if ignoreMatcher != nil && ignoreMatcher.Matches(relPath, info.IsDir()) {
-			if info.IsDir() {
+		if ignoreMatcher != nil && ignoreMatcher.Matches(relPath, d.IsDir()) {
+			if d.IsDir() {
 				return filepath.SkipDir
 			}
 			return nil
@@ -594,13 +628,13 @@ func CollectSourceFiles(rootPath string, langConfig *LanguageConfig, recursive b
 
 		base := filepath.Base(path)
 		if len(base) > 0 && base[0] == '.' && base != ".gitignore" && path != rootPath {
-			if info.IsDir() {
+			if d.IsDir() {
 				return filepath.SkipDir
 			}
 			return nil
 		}
 
-		if info.IsDir() {
+		if d.IsDir() {
 			if !recursive && path != rootPath {
 				return filepath.SkipDir
 			}
@@ -436,6 +436,37 @@ func TestProcessDirectoryIncremental_DetectsChangedFile(t *testing.T) {
 	}
 }
 
+func TestCachedFileChecksum_InvalidatesOnChange(t *testing.T) {
+	filePath := filepath.Join(t.TempDir(), "a.go")
+	mustWrite(t, filePath, "package pkg\n")
+
+	first, err := cachedFileChecksum(filePath)
+	if err != nil {
+		t.Fatalf("cachedFileChecksum() error = %v", err)
+	}
+	again, err := cachedFileChecksum(filePath)
+	if err != nil {
+		t.Fatalf("cachedFileChecksum() error = %v", err)
+	}
+	if again != first {
+		t.Errorf("cached checksum = %s, want %s (file untouched)", again, first)
+	}
+
+	mustWrite(t, filePath, "package pkg\n\nfunc Foo() {}\n")
+	changed, err := cachedFileChecksum(filePath)
+	if err != nil {
+		t.Fatalf("cachedFileChecksum() error = %v", err)
+	}
+	want, _ := computeFileChecksum(filePath)
+	if changed != want || changed == first {
+		t.Errorf("checksum after change = %s, want fresh %s", changed, want)
+	}
+
+	if _, err := cachedFileChecksum(filepath.Join(t.TempDir(), "missing.go")); err == nil {
+		t.Error("cachedFileChecksum() on missing file: want error")
+	}
+}
+
 // --- test helpers ---
 
 func mustWrite(t *testing.T, path, content string) {
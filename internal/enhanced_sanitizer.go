@@ -2,6 +2,7 @@ package internal
 
 import (
 	"strings"
+	"unicode/utf8"
 )
 
 type ParserState int
@@ -77,13 +78,49 @@ func (s ParserState) String() string {
 type Sanitizer struct {
 	config *LanguageConfig
 	useRaw bool
+	// delimStart marks ASCII bytes that can begin a comment, string, char or
+	// docstring delimiter; any other ASCII byte is copied through unchanged.
+	delimStart [utf8.RuneSelf]bool
 }
 
 func NewSanitizer(config *LanguageConfig, useRaw bool) *Sanitizer {
-	return &Sanitizer{
+	s := &Sanitizer{
 		config: config,
 		useRaw: useRaw,
 	}
+	s.buildDelimStart()
+	return s
+}
+
+// buildDelimStart fills delimStart from the first byte of every delimiter
+// the StateNormal handlers can match.
+func (s *Sanitizer) buildDelimStart() {
+	mark := func(delims ...string) {
+		for _, d := range delims {
+			if d != "" && d[0] < utf8.RuneSelf {
+				s.delimStart[d[0]] = true
+			}
+		}
+	}
+	mark(s.config.LineComment, s.config.BlockCommentStart)
+	mark(s.config.StringChars...)
+	mark(s.config.RawStringChars...)
+	mark(s.config.CharDelimiters...)
+	mark(s.config.DocStringMarkers...)
+}
+
+// isPlainASCII reports whether line is pure ASCII and contains no byte that
+// could start a delimiter. Such a line sanitizes to itself in StateNormal, so
+// CleanLine can return it without decoding runes or allocating a buffer.
+// Non-ASCII lines always take the rune-based path.
+func (s *Sanitizer) isPlainASCII(line string) bool {
+	for i := 0; i < len(line); i++ {
+		c := line[i]
+		if c >= utf8.RuneSelf || s.delimStart[c] {
+			return false
+		}
+	}
+	return true
 }
 
 // Helper functions for filling result buffer with spaces
@@ -440,6 +477,11 @@ func (s *Sanitizer) CleanLine(line string, state ParserState) (string, ParserSta
 		return line, state
 	}
 
+	// Fast path: single byte scan, no allocation, for lines with nothing to strip.
+	if state == StateNormal && s.isPlainASCII(line) {
+		return line, state
+	}
+
 	// Size the buffer by rune count, not byte count: a byte-sized buffer would
 	// leave (bytes-runes) trailing spaces on lines containing multibyte runes.
 	runes := []rune(line)
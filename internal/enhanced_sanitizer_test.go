@@ -459,6 +459,44 @@ func TestEnhancedSanitizer_EdgeCases(t *testing.T) {
 		})
 	}
 }
+func TestEnhancedSanitizer_PlainASCIIFastPath(t *testing.T) {
+	s := NewSanitizer(newPythonConfig(), false)
+
+	tests := []struct {
+		name  string
+		input string
+		state State
+		plain bool
+	}{
+		{"plain code", "def foo(x, y):", StateNormal, true},
+		{"line comment", "x = 1  # note", StateNormal, false},
+		{"string", "print('hi')", StateNormal, false},
+		{"docstring", `"""doc"""`, StateNormal, false},
+		{"non-ascii", "x = 1  # ✓", StateNormal, false},
+		{"inside docstring", "still docstring text", StateMultiLineString, false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := s.isPlainASCII(tt.input) && tt.state == StateNormal; got != tt.plain {
+				t.Errorf("fast path for %q = %v, want %v", tt.input, got, tt.plain)
+			}
+			cleaned, _ := s.CleanLine(tt.input, tt.state)
+			if len([]rune(cleaned)) != len([]rune(tt.input)) {
+				t.Errorf("CleanLine(%q) changed rune length: %q", tt.input, cleaned)
+			}
+			if tt.plain && cleaned != tt.input {
+				t.Errorf("CleanLine(%q) = %q, want unchanged", tt.input, cleaned)
+			}
+		})
+	}
+
+	// Still in a docstring: the fast path must not leak its text.
+	if cleaned, state := s.CleanLine("still docstring text", StateMultiLineString); strings.TrimSpace(cleaned) != "" || state != StateMultiLineString {
+		t.Errorf("CleanLine in docstring = %q, %v; want blank, MultiLineString", cleaned, state)
+	}
+}
+
 func TestEnhancedSanitizer_MultiLanguageSupport(t *testing.T) {
 	// Тестируем поддержку разных языков
 	languages := []struct {
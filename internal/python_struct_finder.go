@@ -76,87 +76,78 @@ func (f *PythonStructFinder) FindStructuresInLines(lines []string, startLine int
 	return result, nil
 }
 
-// Python-specific class patterns
+// Python-specific patterns, compiled once at package init.
+// Go's regexp is RE2-based (linear time, no backtracking), so the remaining
+// cost is dispatch: findAllTypes routes each line by its first byte and only
+// runs classPattern on lines that can actually start a class.
 var (
-	// Standard class: class Name:
+	// Standard class: class Name: / class Name(Base1, Base2):
+	// Special kinds (NamedTuple, TypedDict, Enum, ABC, Protocol) are
+	// derived from the captured bases instead of separate per-kind patterns.
 	classPattern = regexp.MustCompile(`^\s*class\s+(\w+)\s*(\(\s*([\w,\s\.\[\]]*)\s*\))?\s*:`)
 
-	// Dataclass: @dataclass\nclass Name:
-	dataclassPattern = regexp.MustCompile(`^\s*@dataclass\s*\nclass\s+(\w+)\s*(\(\s*([\w,\s\.\[\]]*)\s*\))?\s*:`)
-
-	// NamedTuple: class Name(NamedTuple):
-	namedTuplePattern = regexp.MustCompile(`^\s*class\s+(\w+)\s*\(\s*NamedTuple\s*\)\s*:`)
-
-	// TypedDict: class Name(TypedDict):
-	typedDictPattern = regexp.MustCompile(`^\s*class\s+(\w+)\s*\(\s*TypedDict\s*\)\s*:`)
-
-	// Enum: class Name(Enum):
-	enumPattern = regexp.MustCompile(`^\s*class\s+(\w+)\s*\(\s*Enum\s*\)\s*:`)
-
-	// attrs: @attr.s\nclass Name:
-	attrsPattern = regexp.MustCompile(`^\s*@attr\.s\s*\nclass\s+(\w+)\s*(\(\s*([\w,\s\.\[\]]*)\s*\))?\s*:`)
-
-	// ABC: class Name(ABC):
-	abcPattern = regexp.MustCompile(`^\s*class\s+(\w+)\s*\(\s*ABC\s*\)\s*:`)
-
-	// Protocol: class Name(Protocol):
-	protocolPattern = regexp.MustCompile(`^\s*class\s+(\w+)\s*\(\s*Protocol\s*\)\s*:`)
+	// Field patterns: name: type, name: type = value
+	fieldPattern = regexp.MustCompile(`^\s*(\w+)\s*:\s*([\w\[\],\s\.\*]*)\s*(=|$)`)
 )
 
-// findAllTypes finds all type definitions in Python file
+// decoratorKind maps a decorator line to the type kind it implies
+// (@dataclass, @attr.s, ...). Returns "" for unrelated decorators.
+func decoratorKind(trimmed string) string {
+	name := trimmed[1:]
+	if i := strings.IndexAny(name, "( \t"); i >= 0 {
+		name = name[:i]
+	}
+	switch name {
+	case "dataclass", "dataclasses.dataclass":
+		return "dataclass"
+	case "attr.s", "attr.attrs", "attrs.define", "attr.define", "attrs.frozen", "attr.frozen":
+		return "attrs"
+	}
+	return ""
+}
+
+// findAllTypes finds all type definitions in Python file in a single pass.
+// Decorator lines set a pending kind that applies to the next class line.
 func (f *PythonStructFinder) findAllTypes(lines []string, lineOffset int) []TypeBounds {
 	var types []TypeBounds
+	pendingKind := ""
 
 	for lineNum, line := range lines {
 		trimmed := strings.TrimSpace(line)
+		if trimmed == "" {
+			continue
+		}
 
-		// Check for decorators before class
-		if strings.HasPrefix(trimmed, "@") {
-			// Check if next line is a dataclass or attrs class
-			if lineNum+1 < len(lines) {
-				nextLine := strings.TrimSpace(lines[lineNum+1])
-
-				// Dataclass
-				if matches := dataclassPattern.FindStringSubmatch(nextLine); matches != nil {
-					typeName := matches[1]
-					if f.mapMode || f.typeNames[typeName] {
-						endLine := f.findTypeEnd(lines, lineNum+1, lineOffset)
-						types = append(types, TypeBounds{
-							Name:   typeName,
-							Kind:   "dataclass",
-							Start:  lineNum + 1 + 1 + lineOffset,
-							End:    endLine,
-							Fields: []FieldBounds{},
-						})
-					}
-					continue
-				}
-
-				// attrs
-				if matches := attrsPattern.FindStringSubmatch(nextLine); matches != nil {
-					typeName := matches[1]
-					if f.mapMode || f.typeNames[typeName] {
-						endLine := f.findTypeEnd(lines, lineNum+1, lineOffset)
-						types = append(types, TypeBounds{
-							Name:   typeName,
-							Kind:   "attrs",
-							Start:  lineNum + 1 + 1 + lineOffset,
-							End:    endLine,
-							Fields: []FieldBounds{},
-						})
-					}
-					continue
-				}
+		switch trimmed[0] {
+		case '#':
+			continue
+		case '@':
+			if kind := decoratorKind(trimmed); kind != "" {
+				pendingKind = kind
+			}
+			continue
+		case 'c':
+			if !strings.HasPrefix(trimmed, "class") {
+				pendingKind = ""
+				continue
 			}
+		default:
+			pendingKind = ""
+			continue
 		}
 
-		// Check for standard class definitions
-		if matches := classPattern.FindStringSubmatch(trimmed); matches != nil {
-			typeName := matches[1]
-			bases := matches[3] // Base classes if any
+		matches := classPattern.FindStringSubmatch(trimmed)
+		kind := pendingKind
+		pendingKind = ""
+		if matches == nil {
+			continue
+		}
 
+		typeName := matches[1]
+		if kind == "" {
 			// Determine type kind from bases
-			kind := "class"
+			kind = "class"
+			bases := matches[3]
 			switch {
 			case strings.Contains(bases, "NamedTuple"):
 				kind = "NamedTuple"
@@ -169,17 +160,17 @@ func (f *PythonStructFinder) findAllTypes(lines []string, lineOffset int) []Type
 			case strings.Contains(bases, "Protocol"):
 				kind = "Protocol"
 			}
+		}
 
-			if f.mapMode || f.typeNames[typeName] {
-				endLine := f.findTypeEnd(lines, lineNum, lineOffset)
-				types = append(types, TypeBounds{
-					Name:   typeName,
-					Kind:   kind,
-					Start:  lineNum + 1 + lineOffset,
-					End:    endLine,
-					Fields: []FieldBounds{},
-				})
-			}
+		if f.mapMode || f.typeNames[typeName] {
+			endLine := f.findTypeEnd(lines, lineNum, lineOffset)
+			types = append(types, TypeBounds{
+				Name:   typeName,
+				Kind:   kind,
+				Start:  lineNum + 1 + lineOffset,
+				End:    endLine,
+				Fields: []FieldBounds{},
+			})
 		}
 	}
 
@@ -215,10 +206,6 @@ func (f *PythonStructFinder) findTypeEnd(lines []string, startLine int, lineOffs
 func (f *PythonStructFinder) findFieldsForType(lines []string, typeBounds *TypeBounds, lineOffset int) []FieldBounds {
 	var fields []FieldBounds
 
-	// Field patterns for Python
-	// Field patterns: name: type, name: type = value, name = value
-	fieldPattern := regexp.MustCompile(`^\s*(\w+)\s*:\s*([\w\[\],\s\.\*]*)\s*(=|$)`)
-
 	// For dataclass: fields are often defined with type hints
 	// For regular class: look for instance variables in __init__ or class body
 
@@ -0,0 +1,112 @@
+package internal
+
+import (
+	"strings"
+	"testing"
+)
+
+func findPythonTypes(t *testing.T, code string) []TypeBounds {
+	t.Helper()
+	finder := NewPythonStructFinder(*getPyConfig(t), "", true, false)
+	result, err := finder.FindStructuresInLines(strings.Split(code, "\n"), 1, "test.py")
+	if err != nil {
+		t.Fatalf("FindStructuresInLines() error = %v", err)
+	}
+	return result.Types
+}
+
+func TestPythonStructFinder_Kinds(t *testing.T) {
+	code := `from dataclasses import dataclass
+import attr
+
+class Plain:
+    x: int
+
+@dataclass
+class Rect:
+    width: int
+    height: int
+
+@dataclass(frozen=True)
+@total_ordering
+class Frozen:
+    v: int
+
+@attr.s
+class Attrs:
+    a = attr.ib()
+
+class Point(NamedTuple):
+    x: int
+
+class Movie(TypedDict):
+    title: str
+
+class Color(Enum):
+    RED = 1
+
+class Base(ABC):
+    pass
+
+class Greeter(Protocol):
+    name: str
+
+@dataclass
+def not_a_class():
+    pass
+
+class AfterFunc:
+    pass
+`
+	want := []struct {
+		name  string
+		kind  string
+		start int
+	}{
+		{"Plain", "class", 4},
+		{"Rect", "dataclass", 8},
+		{"Frozen", "dataclass", 14},
+		{"Attrs", "attrs", 18},
+		{"Point", "NamedTuple", 21},
+		{"Movie", "TypedDict", 24},
+		{"Color", "enum", 27},
+		{"Base", "abstract", 30},
+		{"Greeter", "Protocol", 33},
+		{"AfterFunc", "class", 40},
+	}
+
+	types := findPythonTypes(t, code)
+	if len(types) != len(want) {
+		t.Fatalf("got %d types, want %d: %+v", len(types), len(want), types)
+	}
+	for i, w := range want {
+		got := types[i]
+		if got.Name != w.name || got.Kind != w.kind || got.Start != w.start {
+			t.Errorf("types[%d] = {%s %s %d}, want {%s %s %d}",
+				i, got.Name, got.Kind, got.Start, w.name, w.kind, w.start)
+		}
+	}
+}
+
+func TestPythonStructFinder_Fields(t *testing.T) {
+	code := `@dataclass
+class Rect:
+    width: int
+    height: int = 0
+    color: str = "black"
+
+    def area(self) -> int:
+        return self.width * self.height
+`
+	types := findPythonTypes(t, code)
+	if len(types) != 1 {
+		t.Fatalf("got %d types, want 1", len(types))
+	}
+	fields := types[0].Fields
+	if len(fields) != 3 {
+		t.Fatalf("got %d fields, want 3: %+v", len(fields), fields)
+	}
+	if fields[0].Name != "width" || fields[0].Type != "int" || fields[0].Line != 3 {
+		t.Errorf("fields[0] = %+v, want width int line 3", fields[0])
+	}
+}
@@ -0,0 +1,5 @@
+# These test_*.py files are funcfinder parser fixtures, not pytest tests.
+# Keep pytest from collecting them: collection would import each module
+# (and AST-rewrite its asserts) on every run, and the fixtures' imports
+# (attr, numba-style decorators, ...) are not meant to resolve.
+collect_ignore_glob = ["test_*.py"]